@@ -0,0 +1,114 @@
+# core/_kernels.py
+# Hot-path numeric kernels. JIT-compiled with numba when it is importable;
+# otherwise the pure-NumPy fallbacks below keep behaviour identical (just
+# without the LLVM loop-vectorized / multi-core speedup).
+from __future__ import annotations
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+@lru_cache(maxsize=None)
+def make_market_model_kernel(est_w0, est_w1, ev_w0, ev_w1):
+    """Market-model batch kernel specialized to fixed window bounds.
+
+    The bounds live as closure constants, so numba sees compile-time window
+    lengths and can fully unroll/vectorize the inner loops with a single
+    SIMD width and no runtime tail handling. One compile per bounds tuple,
+    memoized by lru_cache.
+
+    The returned kernel computes alpha/beta + abnormal returns for all
+    events in one pass: `ret`/`bench` are the full (gap-free over every
+    window) return arrays, `t0_ilocs`/`b_ilocs` the integer positions of
+    each event's t0 in them. Returns (ar_mat, alpha, beta) with ar_mat
+    shaped (n_events, event window).
+    """
+    w_est = est_w1 - est_w0 + 1
+    w_ev = ev_w1 - ev_w0 + 1
+
+    def kernel(ret, bench, t0_ilocs, b_ilocs, use_bench):
+        n = len(t0_ilocs)
+        ar = np.empty((n, w_ev), ret.dtype)
+        alpha = np.empty(n, np.float64)
+        beta = np.empty(n, np.float64)
+
+        for k in prange(n):
+            i0 = t0_ilocs[k]
+            ib = b_ilocs[k]
+
+            sy = 0.0
+            for j in range(w_est):
+                sy += ret[i0 + est_w0 + j]
+            my = sy / w_est
+
+            if use_bench:
+                sx = 0.0
+                for j in range(w_est):
+                    sx += bench[ib + est_w0 + j]
+                mx = sx / w_est
+
+                sxy = 0.0
+                sxx = 0.0
+                for j in range(w_est):
+                    dx = bench[ib + est_w0 + j] - mx
+                    sxy += dx * (ret[i0 + est_w0 + j] - my)
+                    sxx += dx * dx
+
+                if w_est < 10 or sxx <= 0.0:
+                    a = 0.0
+                    b = 0.0
+                else:
+                    b = sxy / sxx
+                    a = my - b * mx
+                alpha[k] = a
+                beta[k] = b
+                for j in range(w_ev):
+                    ar[k, j] = ret[i0 + ev_w0 + j] - (a + b * bench[ib + ev_w0 + j])
+            else:
+                # mean-adjusted model
+                alpha[k] = my
+                beta[k] = 0.0
+                for j in range(w_ev):
+                    ar[k, j] = ret[i0 + ev_w0 + j] - my
+
+        return ar, alpha, beta
+
+    if NUMBA_AVAILABLE:
+        # no cache=True here: numba can't disk-cache closures over freevars
+        return njit(parallel=True, fastmath=True)(kernel)
+    return kernel
+
+
+def market_model_batch(ret, bench, t0_ilocs, b_ilocs, use_bench,
+                       est_w0, est_w1, ev_w0, ev_w1):
+    """Dispatch to the window-specialized kernel (see make_market_model_kernel)."""
+    kernel = make_market_model_kernel(est_w0, est_w1, ev_w0, ev_w1)
+    return kernel(ret, bench, t0_ilocs, b_ilocs, use_bench)
+
+
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, cache=True)
+    def log_returns(p: np.ndarray) -> np.ndarray:
+        """out[i] = log(p[i+1]) - log(p[i]) in one allocation and one sweep."""
+        if len(p) < 2:
+            return np.empty(0, p.dtype)
+        out = np.empty(len(p) - 1, p.dtype)
+        for i in range(len(p) - 1):
+            out[i] = np.log(p[i + 1]) - np.log(p[i])
+        return out
+else:
+    def log_returns(p: np.ndarray) -> np.ndarray:
+        """out[i] = log(p[i+1]) - log(p[i]) with one temp and an in-place subtract."""
+        if len(p) < 2:
+            return np.empty(0, dtype=p.dtype)
+        out = np.empty(len(p) - 1, dtype=p.dtype)
+        np.log(p[1:], out=out)
+        out -= np.log(p[:-1])
+        return out
@@ -1,4 +1,7 @@
 from __future__ import annotations
+import os
+
+import pandas as pd
 import pandera as pa
 from pandera import Column, DataFrameSchema
 
@@ -12,5 +15,23 @@ PriceSchema = DataFrameSchema({
 "volume": Column(float, nullable=True),
 })
 
+REQUIRED_PRICE_COLS = ("symbol", "open", "high", "low", "close")
+
+
+def validate_prices(df: pd.DataFrame) -> pd.DataFrame:
+    """Structural check on a tidy prices frame, run once at load time.
+
+    Default path only asserts the required columns exist — O(columns).
+    Full pandera validation does per-row checks in Python, so it is
+    opt-in via the PRICES_VALIDATE env var.
+    """
+    missing = [c for c in REQUIRED_PRICE_COLS if c not in df.columns]
+    if missing:
+        raise ValueError(f"Prices frame missing columns: {missing}")
+    # explicit compare so PRICES_VALIDATE=0 means off, not "set, so on"
+    if os.environ.get("PRICES_VALIDATE", "").lower() in ("1", "true"):
+        PriceSchema.validate(df)
+    return df
+
 
-# we validate columns and rely on loader to set UTC index.
\ No newline at end of file
+# we validate columns and rely on loader to set UTC index.
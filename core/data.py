@@ -1,11 +1,20 @@
 from __future__ import annotations
 import datetime as dt
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable, Optional
 
 import numpy as np
 import pandas as pd
 import yfinance as yf
 
+from ._kernels import log_returns
+from .contracts import validate_prices
+
+# Yahoo serves roughly this many tickers per quote request
+_MAX_SYMBOLS_PER_REQUEST = 20
+
 
 def _normalize_datetime_column(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -30,19 +39,75 @@ def _normalize_datetime_column(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _cache_path(
+    cache_dir: str,
+    symbols: list[str],
+    interval: str,
+    start,
+    end,
+    auto_adjust: bool,
+) -> str:
+    """Parquet cache file keyed by the full request (symbols, interval,
+    start/end as passed, adjustment flag) plus the UTC date."""
+    key_src = f"{'|'.join(symbols)}:{interval}:{start}:{end}:{auto_adjust}"
+    key = hashlib.md5(key_src.encode()).hexdigest()[:12]
+    today = pd.Timestamp.utcnow().strftime("%Y%m%d")
+    return os.path.join(cache_dir, f"prices_{key}.{today}.parquet")
+
+
+def _batched_download(symbols: list[str], **dl_kwargs) -> pd.DataFrame:
+    """yf.download over parallel chunks of <= 20 symbols.
+
+    For a large watchlist this turns the network wall time from
+    O(symbols x RTT) into roughly O(RTT). Chunks run with threads=False so
+    yfinance's own thread pool doesn't contend with ours.
+    """
+    chunks = [
+        symbols[i:i + _MAX_SYMBOLS_PER_REQUEST]
+        for i in range(0, len(symbols), _MAX_SYMBOLS_PER_REQUEST)
+    ]
+    if len(chunks) == 1:
+        return yf.download(tickers=chunks[0], threads=True, **dl_kwargs)
+
+    with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as pool:
+        frames = list(
+            pool.map(
+                lambda chunk: yf.download(tickers=chunk, threads=False, **dl_kwargs),
+                chunks,
+            )
+        )
+    return pd.concat(frames, axis=1)
+
+
 def fetch_prices(
     symbols: Iterable[str],
     start: Optional[str | dt.datetime] = None,
     end: Optional[str | dt.datetime] = None,
     interval: str = "1h",
     auto_adjust: bool = True,
+    cache_dir: Optional[str] = "cache",
 ) -> pd.DataFrame:
     """
     Fetch OHLCV for multiple symbols as a tidy DataFrame.
 
     Returns columns: [symbol, datetime(index UTC), open, high, low, close, volume]
+
+    Results are memoized to Parquet under `cache_dir`, keyed by symbols,
+    interval and UTC date, so repeat runs on the same day become a columnar
+    read instead of a re-download. Pass cache_dir=None to disable.
     """
     symbols = list(symbols)
+
+    cache_file = (
+        _cache_path(cache_dir, symbols, interval, start, end, auto_adjust)
+        if cache_dir
+        else None
+    )
+    if cache_file is not None and os.path.exists(cache_file):
+        try:
+            return pd.read_parquet(cache_file)
+        except (ImportError, OSError):
+            pass  # no parquet engine or unreadable file: fall through to fetch
     if start is None:
         start = (pd.Timestamp.utcnow() - pd.Timedelta(days=365 * 2)).strftime("%Y-%m-%d")
     if end is None:
@@ -50,10 +115,8 @@ def fetch_prices(
 
     # --- choose query style based on interval constraints ---
     dl_kwargs = dict(
-        tickers=symbols,
         auto_adjust=auto_adjust,
         group_by="ticker",
-        threads=True,
         progress=False,
         interval=interval,
     )
@@ -72,7 +135,7 @@ def fetch_prices(
             end = pd.Timestamp.utcnow().strftime("%Y-%m-%d")
         dl_kwargs.update(start=start, end=end)
 
-    df = yf.download(**dl_kwargs)
+    df = _batched_download(symbols, **dl_kwargs)
 
     def _cleanup_cols(cols):
         return [str(c).strip().lower().replace(" ", "_") for c in cols]
@@ -121,12 +184,64 @@ def fetch_prices(
     if out.empty:
         raise ValueError(f"No price data returned (interval='{interval}'). "
                          f"Try a shorter lookback or a coarser interval (e.g., '2h','4h','1d').")
+    # validate once at load; downstream hot-path code trusts the frame
+    out = validate_prices(out)
+
+    if cache_file is not None:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            out.to_parquet(cache_file)
+        except (ImportError, OSError):
+            pass  # caching is best-effort; the fetched frame is still returned
+
     return out
 
 
 def to_returns(prices: pd.Series) -> pd.Series:
     """Hourly log returns from a price series."""
-    return np.log(prices).diff().dropna()
+    vals = np.ascontiguousarray(prices.to_numpy(), dtype=np.float64)
+    rets = log_returns(vals)
+    return pd.Series(rets, index=prices.index[1:], name=prices.name).dropna()
+
+
+def to_close_panel(prices: pd.DataFrame) -> pd.DataFrame:
+    """Wide (time x symbol) float32 close panel from the tidy long frame.
+
+    A column pluck (panel[symbol]) is O(1) and copy-free, versus the
+    full-table boolean mask + copy that per-symbol access on the long
+    frame costs, and matrix-level ops (log, diff) cover every symbol in
+    one vectorized pass.
+    """
+    if "symbol" not in prices.columns:
+        raise ValueError("Input prices DataFrame must have a 'symbol' column.")
+    wide = prices.pivot(columns="symbol", values="close").sort_index()
+    return wide.astype(np.float32)
+
+
+def prepare_returns(
+    prices: pd.DataFrame,
+    symbols: Optional[Iterable[str]] = None,
+) -> dict[str, pd.Series]:
+    """Hourly log returns per symbol, from one pass over the close panel.
+
+    Accepts either the tidy long frame (pivoted here via to_close_panel) or
+    an already-wide panel. One np.log over the whole (T, S) matrix plus a
+    shifted subtraction serves every symbol at once — in particular the
+    shared benchmark series is computed exactly once. Pass `symbols` to
+    restrict the output.
+    """
+    wide = to_close_panel(prices) if "symbol" in prices.columns else prices
+    if symbols is not None:
+        wanted = set(symbols)
+        wide = wide[[c for c in wide.columns if c in wanted]]
+
+    logp = np.log(wide.to_numpy())
+    rets = logp[1:] - logp[:-1]
+    idx = wide.index[1:]
+    return {
+        sym: pd.Series(rets[:, j], index=idx, name="ret").dropna()
+        for j, sym in enumerate(wide.columns)
+    }
 
 
 def ensure_symbol_frame(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
@@ -6,7 +6,14 @@ import numpy as np
 import pandas as pd
 
 from .data import ensure_symbol_frame, to_returns
-from .stats import ols_alpha_beta, bootstrap_car_ci
+from .stats import ols_alpha_beta_batch, bootstrap_car_ci, bootstrap_car_ci_batch, ci_bounds_95
+from ._kernels import NUMBA_AVAILABLE, make_market_model_kernel
+
+# Hot-path arrays are float32: hourly-return/CAR magnitudes don't need
+# float64, and the window slicing / cumsum / mean reductions are
+# memory-bound, so halving the element size roughly halves their cost.
+# Aggregates are upcast to float64 on the way out.
+_RET_DTYPE = np.float32
 
 
 @dataclass
@@ -43,40 +50,118 @@ class AggregateResult:
     per_event: List[EventResult]
 
 
+_HOUR_NS = 3_600_000_000_000
+
+
+def _masked_cumsum(a: np.ndarray, axis: int = -1) -> np.ndarray:
+    """Cumulative sum that skips NaNs but keeps them in place (pandas
+    Series.cumsum semantics), without per-row Series objects."""
+    mask = np.isnan(a)
+    out = np.where(mask, 0.0, a).cumsum(axis=axis)
+    out[mask] = np.nan
+    return out
+
+
 def _slice_window(s: pd.Series, t0: pd.Timestamp, window: tuple[int, int]) -> pd.Series:
-    # Align to hourly frequency and reindex to exact relative hours
-    s = s.asfreq("h")
-    idx = pd.date_range(
-        t0 + pd.Timedelta(hours=window[0]),
-        t0 + pd.Timedelta(hours=window[1]),
-        freq="h",
-        tz="UTC",
+    """Reindex `s` onto the exact relative hours of `window` around t0.
+
+    Gap/edge fallback for _window_values: two get_slice_bound binary
+    searches bound the raw values, which are then placed by integer hour
+    offset into a NaN-padded output — no asfreq pass over the full series
+    and no hash-based reindex alignment.
+    """
+    start = t0 + pd.Timedelta(hours=window[0])
+    end = t0 + pd.Timedelta(hours=window[1])
+    idx = s.index
+    lo = idx.get_slice_bound(start, side="left")
+    hi = idx.get_slice_bound(end, side="right")
+
+    out_idx = pd.date_range(start, end, freq="h")
+    dtype = s.dtype if s.dtype.kind == "f" else np.float64
+    out = np.full(len(out_idx), np.nan, dtype=dtype)
+
+    offsets_ns = idx[lo:hi].as_unit("ns").asi8 - start.value
+    on_grid = offsets_ns % _HOUR_NS == 0
+    out[offsets_ns[on_grid] // _HOUR_NS] = s.values[lo:hi][on_grid]
+    return pd.Series(out, index=out_idx)
+
+
+def _dense_ilocs(
+    idx: pd.DatetimeIndex, t0s: pd.DatetimeIndex, w0: int, w1: int
+) -> np.ndarray:
+    """Integer positions of each t0 in `idx` where the hourly index is dense
+    over `w0..w1` hours relative to t0; -1 where t0 is off-grid, the window
+    runs past the data, or the index has gaps inside the window.
+
+    One searchsorted call covers every event; the density test compares the
+    window-endpoint timestamps against the exact relative hours in int64 ns.
+    """
+    i0 = np.asarray(idx.searchsorted(t0s), dtype=np.int64)
+    n = len(idx)
+    out = np.full(len(t0s), -1, dtype=np.int64)
+    ok = (i0 + w0 >= 0) & (i0 + w1 < n) & (i0 < n)
+    if not ok.any():
+        return out
+
+    # asi8 units follow the index resolution (ns vs us); pin both to ns
+    vals = idx.as_unit("ns").asi8
+    t_ns = t0s.as_unit("ns").asi8[ok]
+    j = i0[ok]
+    dense = (
+        (vals[j] == t_ns)
+        # endpoints on the exact relative hours => no gaps in between
+        & (vals[j + w0] == t_ns + w0 * _HOUR_NS)
+        & (vals[j + w1] == t_ns + w1 * _HOUR_NS)
     )
-    return s.reindex(idx)
+    out[ok] = np.where(dense, j, -1)
+    return out
+
 
+def _dense_iloc(idx: pd.DatetimeIndex, t0: pd.Timestamp, w0: int, w1: int) -> int:
+    """Scalar convenience wrapper around _dense_ilocs."""
+    return int(_dense_ilocs(idx, pd.DatetimeIndex([t0]), w0, w1)[0])
 
-def _market_model_ar(
-    target_rets: pd.Series,
-    bench_rets: Optional[pd.Series],
+
+def _window_values(
+    arr: np.ndarray,
+    idx: pd.DatetimeIndex,
     t0: pd.Timestamp,
-    windows: Windows,
-) -> tuple[pd.Series, float, float]:
-    est = _slice_window(target_rets, t0, windows.estimation).dropna()
+    window: tuple[int, int],
+) -> np.ndarray:
+    """Values of `arr` over `window` hours relative to t0, as a plain ndarray.
+
+    Fast path: an O(1) integer slice when the index is dense over the window;
+    otherwise the reindex-based _slice_window fallback.
+    """
+    w0, w1 = window
+    i0 = _dense_iloc(idx, t0, w0, w1)
+    if i0 >= 0:
+        return arr[i0 + w0 : i0 + w1 + 1]
+    return _slice_window(pd.Series(arr, index=idx), t0, window).to_numpy()
 
-    if bench_rets is None:
-        # mean-adjusted model
-        mu = est.mean() if len(est) > 0 else 0.0
-        ar = _slice_window(target_rets, t0, windows.event) - mu
-        return ar, float(mu), 0.0
 
-    est_b = _slice_window(bench_rets, t0, windows.estimation)
-    alpha, beta = ols_alpha_beta(est_b, est)
+def _market_model_ar_batch(
+    est_y: np.ndarray,
+    est_x: Optional[np.ndarray],
+    ev_y: np.ndarray,
+    ev_x: Optional[np.ndarray],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Abnormal returns for all events at once.
 
-    ev_t = _slice_window(target_rets, t0, windows.event)
-    ev_b = _slice_window(bench_rets, t0, windows.event)
-    fitted = alpha + beta * ev_b
-    ar = ev_t - fitted
-    return ar, alpha, beta
+    `est_y`/`ev_y` are (n_events, window) matrices of target returns over the
+    estimation / event windows; `est_x`/`ev_x` the matching benchmark windows
+    (None -> mean-adjusted model). Returns (ar_mat, alphas, betas).
+    """
+    if est_x is None:
+        # mean-adjusted model: alpha is the estimation-window mean
+        counts = (~np.isnan(est_y)).sum(axis=1)
+        mu = np.nansum(est_y, axis=1) / np.maximum(counts, 1)
+        mu = np.where(counts > 0, mu, 0.0)
+        return ev_y - mu[:, None], mu, np.zeros_like(mu)
+
+    alphas, betas = ols_alpha_beta_batch(est_x, est_y)
+    ar_mat = ev_y - (alphas[:, None] + betas[:, None] * ev_x)
+    return ar_mat, alphas, betas
 
 
 def run_event_study(
@@ -86,70 +171,164 @@ def run_event_study(
     bench_prices: Optional[pd.DataFrame] = None,
     cfg: Optional[ModelCfg] = None,
     windows: Optional[Windows] = None,
+    sym_ret: Optional[pd.Series] = None,
+    bench_ret: Optional[pd.Series] = None,
 ) -> AggregateResult:
     cfg = cfg or ModelCfg()
     windows = windows or Windows()
 
-    sym_df = ensure_symbol_frame(prices, symbol)
-    sym_ret = to_returns(sym_df["close"]).rename("ret")
+    # Callers looping over many symbols can pass precomputed hourly log
+    # returns (sym_ret / bench_ret) to skip the filter + log/diff pass here.
+    if sym_ret is None:
+        sym_df = ensure_symbol_frame(prices, symbol)
+        sym_ret = to_returns(sym_df["close"]).rename("ret")
 
-    bench_ret = None
-    if cfg.benchmark and bench_prices is not None and symbol != cfg.benchmark:
-        bdf = ensure_symbol_frame(bench_prices, cfg.benchmark)
-        bench_ret = to_returns(bdf["close"]).rename("bench_ret")
+    if not cfg.benchmark or symbol == cfg.benchmark:
+        bench_ret = None
+    elif bench_ret is None:
+        if bench_prices is not None:
+            bdf = ensure_symbol_frame(bench_prices, cfg.benchmark)
+            bench_ret = to_returns(bdf["close"]).rename("bench_ret")
 
-    per_event: List[EventResult] = []
+    # Work on the raw arrays + index from here on; per-event slicing is then
+    # integer arithmetic instead of asfreq/reindex allocations.
+    ret_arr = np.ascontiguousarray(sym_ret.to_numpy(), dtype=_RET_DTYPE)
+    ret_idx = sym_ret.index
+    if bench_ret is not None:
+        bench_arr = np.ascontiguousarray(bench_ret.to_numpy(), dtype=_RET_DTYPE)
+        bench_idx = bench_ret.index
 
-    for _, row in events.iterrows():
-        if row.symbol != symbol:
-            continue
-        t0: pd.Timestamp = pd.to_datetime(row.ts_utc, utc=True)
+    # one boolean mask + column pulls; no iterrows/Series boxing per event
+    ev_sym = events[events.symbol == symbol]
+    ids: List[str] = ev_sym["event_id"].astype(str).tolist()
+    t0s = pd.to_datetime(ev_sym["ts_utc"].values, utc=True)
 
-        ar, alpha, beta = _market_model_ar(sym_ret, bench_ret, t0, windows)
-        car = ar.cumsum()
+    if not ids:
+        raise ValueError(f"No events for {symbol}")
 
-        # Bootstrap CI for CAR over the full event window (optional)
-        ci = (np.nan, np.nan)
-        if cfg.use_bootstrap:
-            full_len = len(ar.dropna())
-            est_series = _slice_window(sym_ret, t0, windows.estimation).dropna()
-            if full_len > 3 and len(est_series) > full_len + 10:
-                low, high = bootstrap_car_ci(est_series, full_len, n_iter=cfg.n_boot)
-                ci = (low, high)
+    # When every event sits on a dense stretch of the hourly grid (the common
+    # case), the whole fit runs in the fused JIT kernel straight off the raw
+    # arrays. Gaps/edges drop back to the window-matrix + batched-OLS path.
+    w_lo = min(windows.estimation[0], windows.event[0])
+    w_hi = max(windows.estimation[1], windows.event[1])
+    t_ilocs = _dense_ilocs(ret_idx, t0s, w_lo, w_hi)
+    if bench_ret is not None:
+        b_ilocs = _dense_ilocs(bench_idx, t0s, w_lo, w_hi)
+    else:
+        b_ilocs = np.zeros(len(ids), dtype=np.int64)
+    dense = bool((t_ilocs >= 0).all() and (b_ilocs >= 0).all())
+
+    if dense and NUMBA_AVAILABLE:
+        bench_in = bench_arr if bench_ret is not None else ret_arr[:0]
+        # kernel is specialized (and compiled once) per window configuration
+        kernel = make_market_model_kernel(
+            windows.estimation[0], windows.estimation[1],
+            windows.event[0], windows.event[1],
+        )
+        ar_mat, alphas, betas = kernel(
+            ret_arr, bench_in, t_ilocs, b_ilocs, bench_ret is not None
+        )
+    elif dense:
+        # without numba the kernel is a plain Python loop; gather the dense
+        # windows with fancy indexing and use the vectorized batched OLS
+        est_off = np.arange(windows.estimation[0], windows.estimation[1] + 1)
+        ev_off = np.arange(windows.event[0], windows.event[1] + 1)
+        est_y = ret_arr[t_ilocs[:, None] + est_off]
+        ev_y = ret_arr[t_ilocs[:, None] + ev_off]
+        est_x = ev_x = None
+        if bench_ret is not None:
+            est_x = bench_arr[b_ilocs[:, None] + est_off]
+            ev_x = bench_arr[b_ilocs[:, None] + ev_off]
+        ar_mat, alphas, betas = _market_model_ar_batch(est_y, est_x, ev_y, ev_x)
+    else:
+        est_y = np.vstack(
+            [_window_values(ret_arr, ret_idx, t0, windows.estimation) for t0 in t0s]
+        )
+        ev_y = np.vstack(
+            [_window_values(ret_arr, ret_idx, t0, windows.event) for t0 in t0s]
+        )
+        est_x = ev_x = None
+        if bench_ret is not None:
+            est_x = np.vstack(
+                [_window_values(bench_arr, bench_idx, t0, windows.estimation) for t0 in t0s]
+            )
+            ev_x = np.vstack(
+                [_window_values(bench_arr, bench_idx, t0, windows.event) for t0 in t0s]
+            )
+        ar_mat, alphas, betas = _market_model_ar_batch(est_y, est_x, ev_y, ev_x)
+
+    # Bootstrap CI for CAR over the full event window (optional). On the dense
+    # path every estimation window is a slice of ret_arr, so all events share
+    # one cumulative-sum prefix and a single (n_events, n_boot) draw.
+    n_events = len(ids)
+    ci_low = np.full(n_events, np.nan)
+    ci_high = np.full(n_events, np.nan)
+    if cfg.use_bootstrap:
+        full_lens = (~np.isnan(ar_mat)).sum(axis=1)
+        if dense:
+            est_los = t_ilocs + windows.estimation[0]
+            est_his = t_ilocs + windows.estimation[1] + 1
+            ok = (full_lens > 3) & ((est_his - est_los) > full_lens + 10)
+            low, high = bootstrap_car_ci_batch(
+                ret_arr, est_los, est_his, full_lens, n_iter=cfg.n_boot
+            )
+            ci_low = np.where(ok, low, np.nan)
+            ci_high = np.where(ok, high, np.nan)
+        else:
+            for k in range(n_events):
+                est_vals = est_y[k]
+                est_vals = est_vals[~np.isnan(est_vals)]
+                full_len = int(full_lens[k])
+                if full_len > 3 and len(est_vals) > full_len + 10:
+                    ci_low[k], ci_high[k] = bootstrap_car_ci(
+                        est_vals, full_len, n_iter=cfg.n_boot
+                    )
+
+    ev_offsets = pd.to_timedelta(
+        np.arange(windows.event[0], windows.event[1] + 1), unit="h"
+    )
+
+    # CAR for every event in one pass over the (n_events, W) matrix
+    car_mat = _masked_cumsum(ar_mat, axis=1)
+
+    per_event: List[EventResult] = []
+    for k, (eid, t0) in enumerate(zip(ids, t0s)):
+        ar = pd.Series(ar_mat[k], index=t0 + ev_offsets)
+        car = pd.Series(car_mat[k], index=ar.index)
 
         per_event.append(
             EventResult(
-                event_id=str(row.event_id),
+                event_id=eid,
                 symbol=symbol,
                 t0=t0,
                 ar=ar,
                 car=car,
-                alpha=float(alpha),
-                beta=float(beta),
-                car_ci=(float(ci[0]) if pd.notna(ci[0]) else np.nan,
-                        float(ci[1]) if pd.notna(ci[1]) else np.nan),
+                alpha=float(alphas[k]),
+                beta=float(betas[k]),
+                car_ci=(float(ci_low[k]) if pd.notna(ci_low[k]) else np.nan,
+                        float(ci_high[k]) if pd.notna(ci_high[k]) else np.nan),
             )
         )
 
-    if not per_event:
-        raise ValueError(f"No events for {symbol}")
-
-    # Align AR by relative hour across events
-    aligned_ar = pd.concat(
-        [e.ar.reset_index(drop=True).rename(e.event_id) for e in per_event],
-        axis=1,
-    )
-    mean_ar = aligned_ar.mean(axis=1)
-    mean_ar.index = pd.RangeIndex(
-        start=windows.event[0], stop=windows.event[1] + 1, step=1
+    # Mean AR across events by relative hour, straight off the AR matrix
+    # (rows are already aligned by construction; no concat of N Series)
+    nan_mask = np.isnan(ar_mat)
+    counts = (~nan_mask).sum(axis=0)
+    sums = np.where(nan_mask, 0.0, ar_mat).sum(axis=0, dtype=np.float64)
+    mean_ar = pd.Series(
+        np.where(counts > 0, sums / np.maximum(counts, 1), np.nan),
+        index=pd.RangeIndex(
+            start=windows.event[0], stop=windows.event[1] + 1, step=1
+        ),
     )
-    mean_car = mean_ar.cumsum()
+    mean_car = pd.Series(_masked_cumsum(mean_ar.to_numpy()), index=mean_ar.index)
 
     # Aggregate CI from dispersion of final CARs across events
-    final_cars = [e.car.dropna().iloc[-1] if len(e.car.dropna()) else np.nan for e in per_event]
-    final_cars = [x for x in final_cars if pd.notna(x)]
+    has_car = (~np.isnan(car_mat)).any(axis=1)
+    last_pos = car_mat.shape[1] - 1 - np.argmax(~np.isnan(car_mat)[:, ::-1], axis=1)
+    final_cars = car_mat[np.arange(car_mat.shape[0]), last_pos][has_car]
     if len(final_cars) >= 5:
-        agg_low, agg_high = np.nanpercentile(final_cars, [2.5, 97.5])
+        agg_low, agg_high = ci_bounds_95(final_cars.astype(np.float64))
     else:
         agg_low, agg_high = (np.nan, np.nan)
 
@@ -5,8 +5,19 @@ REQUIRED_COLS = [
     "event_id", "ts_utc", "symbol", "category", "headline", "source", "direction"
 ]
 
+# explicit dtypes skip pandas' per-column inference scan and avoid
+# object-dtype columns; symbol/category repeat heavily -> categorical
+_EVENT_DTYPES = {
+    "event_id": "string",
+    "symbol": "category",
+    "category": "category",
+    "headline": "string",
+    "source": "string",
+    "direction": "string",
+}
+
 def load_events_csv(path: str) -> pd.DataFrame:
-    df = pd.read_csv(path)
+    df = pd.read_csv(path, dtype=_EVENT_DTYPES)
     missing = [c for c in REQUIRED_COLS if c not in df.columns]
     if missing:
         raise ValueError(f"Events CSV missing columns: {missing}")
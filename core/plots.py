@@ -5,13 +5,43 @@ from typing import Optional, Tuple
 
 import numpy as np
 import pandas as pd
+import matplotlib
+
+# headless (run.ps1 sets RUN_MODE=batch): Agg skips GUI backend setup and
+# is the cheapest rasterizer for save-to-PNG workloads
+_HEADLESS = os.environ.get("RUN_MODE", "interactive") != "interactive"
+if _HEADLESS:
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 
+_fig_cache: dict[tuple, tuple] = {}
+
 
 def _ensure_outdir(outdir: str) -> None:
     os.makedirs(outdir, exist_ok=True)
 
 
+def _get_fig(figsize=(7, 4)):
+    """Figure/axes pair: fresh per call interactively, reused (cleared) in
+    headless runs so per-event loops don't pay figure teardown each time."""
+    if not _HEADLESS:
+        return plt.subplots(figsize=figsize)
+    if figsize not in _fig_cache:
+        _fig_cache[figsize] = plt.subplots(figsize=figsize)
+    fig, ax = _fig_cache[figsize]
+    ax.clear()
+    return fig, ax
+
+
+def _teardown(fig, show: bool) -> None:
+    if _HEADLESS:
+        return  # keep the cached figure alive; nothing to show
+    if show:
+        plt.show()
+    plt.close(fig)
+
+
 def _finalize(fig, ax, title: Optional[str]) -> None:
     if title:
         ax.set_title(title)
@@ -30,7 +60,7 @@ def plot_mean_ar(mean_ar: pd.Series, outdir: str, title: Optional[str] = None,
 
     rel_hours = np.arange(len(mean_ar)) - (len(mean_ar) // 2)
 
-    fig, ax = plt.subplots(figsize=(7, 4))
+    fig, ax = _get_fig((7, 4))
     ax.plot(rel_hours, mean_ar.values)
     ax.axvline(0, linestyle="--")
     ax.set_xlabel("Hours relative to event")
@@ -39,9 +69,7 @@ def plot_mean_ar(mean_ar: pd.Series, outdir: str, title: Optional[str] = None,
 
     path = os.path.join(outdir, name)
     fig.savefig(path, dpi=120, bbox_inches="tight")
-    if show:
-        plt.show()
-    plt.close(fig)
+    _teardown(fig, show)
     return path
 
 
@@ -57,7 +85,7 @@ def plot_mean_car(mean_car: pd.Series, ci: Optional[Tuple[float, float]],
 
     rel_hours = np.arange(len(mean_car)) - (len(mean_car) // 2)
 
-    fig, ax = plt.subplots(figsize=(7, 4))
+    fig, ax = _get_fig((7, 4))
     ax.plot(rel_hours, mean_car.values, label="Mean CAR")
     ax.axvline(0, linestyle="--")
     if ci is not None:
@@ -72,9 +100,7 @@ def plot_mean_car(mean_car: pd.Series, ci: Optional[Tuple[float, float]],
 
     path = os.path.join(outdir, name)
     fig.savefig(path, dpi=120, bbox_inches="tight")
-    if show:
-        plt.show()
-    plt.close(fig)
+    _teardown(fig, show)
     return path
 
 
@@ -95,7 +121,7 @@ def plot_price_with_event(price: pd.Series, t0: pd.Timestamp,
     if title is None:
         title = f"Price around event @ {t0}"
 
-    fig, ax = plt.subplots(figsize=(7, 4))
+    fig, ax = _get_fig((7, 4))
     ax.plot(s.index, s.values)
     ax.axvline(t0, linestyle="--")
     ax.set_xlabel("Time (UTC)")
@@ -104,7 +130,5 @@ def plot_price_with_event(price: pd.Series, t0: pd.Timestamp,
 
     path = os.path.join(outdir, name)
     fig.savefig(path, dpi=120, bbox_inches="tight")
-    if show:
-        plt.show()
-    plt.close(fig)
+    _teardown(fig, show)
     return path
@@ -14,7 +14,7 @@ import math
 import numpy as np
 import pandas as pd
 
-from core.data import fetch_prices, ensure_symbol_frame, to_returns
+from core.data import fetch_prices, prepare_returns, to_close_panel
 from core.events import load_events_csv
 from core.event_study import run_event_study, ModelCfg, Windows
 from core.plots import plot_mean_ar, plot_mean_car, plot_price_with_event
@@ -64,6 +64,14 @@ if prices.empty:
         "Try INTERVAL='2h' or '1d' instead."
     )
 
+# wide (time x symbol) close panel: O(1) per-symbol column plucks for the
+# hot path instead of boolean masks over the long frame
+close_wide = to_close_panel(prices)
+
+# hourly log returns, computed once per symbol (run_event_study would
+# otherwise redo the filter + log/diff for target and benchmark each call)
+returns_by_symbol = prepare_returns(close_wide, SYMBOLS)
+
 # %% [markdown]
 # ## 2) Run event study per symbol
 
@@ -84,6 +92,8 @@ for sym in SYMBOLS:
         bench_prices=bench_prices,
         cfg=CFG,
         windows=WINS,
+        sym_ret=returns_by_symbol.get(sym),
+        bench_ret=returns_by_symbol.get(BENCHMARK),
     )
     reports[sym] = agg
     print(sym, "events:", len(agg.per_event))
@@ -94,21 +104,19 @@ for sym in SYMBOLS:
 # %%
 for sym, agg in reports.items():
     # if no rows for this symbol, skip plotting
-    if "symbol" in prices.columns:
-        sym_rows = (prices["symbol"] == sym).sum()
-        if sym_rows == 0:
-            print(f"{sym}: no price rows; skip plots")
-            continue
+    if sym not in close_wide.columns or close_wide[sym].notna().sum() == 0:
+        print(f"{sym}: no price rows; skip plots")
+        continue
 
     # AR and CAR plots
     plot_mean_ar(agg.mean_ar, outdir=FIGDIR, title=f"{sym} - Mean AR")
     plot_mean_car(agg.mean_car, ci=agg.car_ci, outdir=FIGDIR, title=f"{sym} - Mean CAR")
 
     # per-event price traces
-    sym_df = ensure_symbol_frame(prices, sym)
+    sym_close = close_wide[sym].dropna()
     for ev in agg.per_event:
         plot_price_with_event(
-            sym_df["close"], ev.t0, outdir=FIGDIR, name=f"{sym}_{ev.event_id}_price.png"
+            sym_close, ev.t0, outdir=FIGDIR, name=f"{sym}_{ev.event_id}_price.png"
         )
 
 # %% [markdown]
@@ -0,0 +1,13 @@
+import pandas as pd
+
+from core.events import load_events_csv
+
+
+def test_load_sample_events():
+    df = load_events_csv("data_raw/events_sample.csv")
+
+    assert str(df["ts_utc"].dtype).startswith("datetime64")
+    assert df["ts_utc"].dt.tz is not None
+    assert df["ts_utc"].is_monotonic_increasing
+    assert isinstance(df["symbol"].dtype, pd.CategoricalDtype)
+    assert set(df["direction"].unique()) <= {"pos", "neg", "neutral"}
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from core.stats import (
+    ols_alpha_beta,
+    ols_alpha_beta_batch,
+    bootstrap_car_ci,
+    bootstrap_car_ci_batch,
+)
+
+
+def test_ols_batch_matches_scalar():
+    rng = np.random.default_rng(0)
+    x = rng.normal(0, 0.01, size=(5, 100))
+    y = 0.001 + 2.0 * x + rng.normal(0, 0.001, size=(5, 100))
+
+    alphas, betas = ols_alpha_beta_batch(x, y)
+    for k in range(5):
+        a, b = ols_alpha_beta(pd.Series(x[k]), pd.Series(y[k]))
+        assert abs(alphas[k] - a) < 1e-10
+        assert abs(betas[k] - b) < 1e-10
+
+
+def test_bootstrap_batch_gating_and_bounds():
+    rng = np.random.default_rng(1)
+    rets = rng.normal(0, 0.002, size=500)
+
+    low, high = bootstrap_car_ci_batch(
+        rets,
+        est_los=np.array([0, 0]),
+        est_his=np.array([300, 50]),
+        window_lens=np.array([49, 49]),  # second event: window too long -> NaN
+    )
+    assert np.isfinite(low[0]) and np.isfinite(high[0]) and low[0] < high[0]
+    assert np.isnan(low[1]) and np.isnan(high[1])
+
+    # scalar path agrees on gating and produces a comparable interval
+    s_low, s_high = bootstrap_car_ci(rets[:300], 49)
+    assert s_low < 0 < s_high
+    assert low[0] < 0 < high[0]